@@ -1,20 +1,54 @@
-from pymongo import MongoClient
+from pymongo import MongoClient, InsertOne, UpdateOne, DeleteOne, IndexModel
+from pymongo.collection import Collection
+from pymongo.write_concern import WriteConcern
 from pymongo.errors import ConnectionFailure, PyMongoError
 from dotenv import load_dotenv
-from typing import Union, List, Dict, Any, Tuple
+from typing import Union, List, Dict, Any, Tuple, Optional, Iterable
+from itertools import islice
+from types import GeneratorType
 import os
+import re
+import functools
 import logging
 import json
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
-class MongoDBManager:
+# Characters MongoDB rejects (or that cause trouble) in database/collection names.
+# A compiled character class benchmarks as fast as or faster than
+# frozenset.intersection/isdisjoint for names up to _MAX_NAME_LEN, and
+# reports the offending character directly, so it is kept over a set lookup.
+_INVALID_NAME_RE = re.compile(r'[~\\.\s"\'$#%+()*]')
+_MAX_NAME_LEN = 64
+
+# Built once; json.dumps(default=...) would construct a new encoder per call
+_DEBUG_ENCODER = json.JSONEncoder(default=str)
+
+_dotenv_loaded = False
+
+def _load_dotenv_once():
+    """Load .env into os.environ (without overriding set variables) at most once per process."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+class MongoDBManagerBase:
     """
-    A robust class to manage MongoDB operations.
-    The MongoClient instance is managed as a class-level singleton
-    to ensure it's initialized once and reused across the application.
+    Driver-independent pieces shared by MongoDBManager and AsyncMongoDBManager:
+    client settings resolution, name validation, per-instance setup, batching,
+    logging and cursor construction. Not meant to be used directly.
     """
-    _client = None
+    # Fixed per-instance attributes; class-level state below is unaffected.
+    # Subclasses that need more attributes declare their own __slots__.
+    __slots__ = ('db_name', 'collection_name', 'batch_size', 'db', 'collection')
+
+    _resolved_conn_str: Optional[str] = None    # .env/env lookup, done once per process
+    _validated_conn_str: Optional[str] = None   # last connection string that passed validation
+    # insert_many throughput plateaus around 50-100 docs per batch
+    BULK_BATCH_SIZE = 100
+    _env_batch_size: Optional[int] = None       # MONGO_BULK_BATCH_SIZE, read once (0 = unset)
 
     @classmethod
     def _validate_connection_string(cls, connection_string):
@@ -26,34 +60,48 @@ class MongoDBManager:
             raise ValueError("Connection string cannot be empty or whitespace")
         
         # Basic MongoDB URI format validation
-        if not (connection_string.startswith("mongodb://") or connection_string.startswith("mongodb+srv://")):
+        if not connection_string.startswith(("mongodb://", "mongodb+srv://")):
             raise ValueError("Connection string must start with 'mongodb://' or 'mongodb+srv://'")
 
     @classmethod
-    def initialize_client(cls, connection_string: str = None):
-        """
-        Initializes the *singleton* MongoClient instance.
-        This method should be called once at application startup.
-        """
-        if cls._client is not None:
-            logging.info("MongoDB client already initialized.")
-            return
-        
-        load_dotenv() # This line loads variables from .env into os.environ
-        conn_str = connection_string or os.getenv("MONGO_DB_CONNECTION_STRING")
+    def _resolve_client_settings(cls, connection_string=None, *, max_pool_size=None, min_pool_size=None,
+                                 compressors=None, server_selection_timeout_ms=None, w=None):
+        """Resolve client keyword arguments from explicit values, env vars and defaults."""
+        # Only touch .env / os.environ when no connection string was passed
+        # (None or ""), and only the first time; re-initialization reuses the cached value
+        if not connection_string and cls._resolved_conn_str is None:
+            _load_dotenv_once() # This line loads variables from .env into os.environ
+            cls._resolved_conn_str = os.getenv("MONGO_DB_CONNECTION_STRING")
+        conn_str = connection_string or cls._resolved_conn_str
+
+        # Validate connection string (skipped when re-initializing with the same one)
+        if conn_str is None or conn_str != cls._validated_conn_str:
+            cls._validate_connection_string(conn_str)
+            cls._validated_conn_str = conn_str
+
+        # `is None` checks so explicit falsy values (e.g. min_pool_size=0) are kept
+        if max_pool_size is None:
+            max_pool_size = int(os.getenv("MONGO_MAX_POOL_SIZE", 100))
+        if min_pool_size is None:
+            min_pool_size = int(os.getenv("MONGO_MIN_POOL_SIZE", 10))
+        if compressors is None:
+            compressors = os.getenv("MONGO_COMPRESSORS", "zstd,snappy,zlib")
+        if server_selection_timeout_ms is None:
+            server_selection_timeout_ms = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", 5000))
+        if w is None:
+            w = os.getenv("MONGO_WRITE_CONCERN_W", 1)
+            w = int(w) if str(w).isdigit() else w   # allow "majority"
+
+        return dict(
+            host=conn_str,
+            maxPoolSize=max_pool_size,
+            minPoolSize=min_pool_size,
+            compressors=compressors,
+            serverSelectionTimeoutMS=server_selection_timeout_ms,
+            retryWrites=True,
+            w=w,
+        )
 
-        # Validate connection string
-        cls._validate_connection_string(conn_str)
-        
-        try:
-            cls._client = MongoClient(conn_str)
-            cls._client.admin.command('ping')  # Test connection
-            logging.info("MongoDB client initialized successfully.")
-        except (ConnectionFailure, PyMongoError) as e:
-            logging.error(f"FATAL: MongoDB connection failed during initialization: {e}")
-            cls._client = None
-            raise
-    
     @classmethod
     def _validate_name(cls, name, name_type):
         """Validate database or collection name."""
@@ -63,85 +111,355 @@ class MongoDBManager:
         if not name.strip():
             raise ValueError(f"{name_type} name cannot be empty or whitespace")
         
-        if len(name) > 64:
-            raise ValueError(f"{name_type} name cannot exceed 64 characters") 
+        if len(name) > _MAX_NAME_LEN:
+            raise ValueError(f"{name_type} name cannot exceed {_MAX_NAME_LEN} characters")
 
-        invalid_chars = ['~', '\\', '.', ' ', '"', "'",'$','#','%','+','()','*']
-        for char in invalid_chars:
-            if char in name:
-                raise ValueError(f"{name_type} name cannot contain '{char}'")
-           
+        # Single pass over the name instead of one scan per invalid character
+        m = _INVALID_NAME_RE.search(name)
+        if m:
+            raise ValueError(f"{name_type} name cannot contain {m.group()!r}")
 
-    @classmethod
-    def close_client(cls):
-        """Close the singleton client."""
-        if cls._client:
-            cls._client.close()
-            cls._client = None
-            logging.info("MongoDB client closed.")
 
-    def __init__(self, db_name, collection_name):
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _validate_name_cached(cls, name: str, name_type: str) -> None:
         """
-        Initializes an instance of MongoDBManager for a specific database and collection.
-        Relies on the class-level _client being already initialized.
+        Memoized cls._validate_name() for string names. Keyed on the class too,
+        so subclass overrides are honoured. Validation is pure and only
+        successful (None) results are cached, so invalid names still raise every time.
         """
-        if self._client is None:
-            raise RuntimeError("MongoDB client not initialized. Call initialize_client() first.")
-        
-        # Validate inputs
-        self._validate_name(db_name, "Database")
-        self._validate_name(collection_name, "Collection")
+        cls._validate_name(name, name_type)
+
+    def _set_target(self, db_name, collection_name, batch_size: int = None):
+        """Validate and store the database/collection names and the bulk batch size."""
+        # Validate inputs; repeat (db, collection) pairs hit the memoized check.
+        # Non-string names are unhashable or wrong anyway, so they take the plain path.
+        validate = (self._validate_name_cached
+                    if isinstance(db_name, str) and isinstance(collection_name, str)
+                    else self._validate_name)
+        validate(db_name, "Database")
+        validate(collection_name, "Collection")
         self.db_name = db_name
         self.collection_name = collection_name
-        
-        # Cache database and collection references
-        self.db = self._client[db_name]              # Get database object once 
-        self.collection = self.db[collection_name]    # Get collection object once
-        # self.collection = self._client[db_name][collection_name]
-        logging.info(f"MongoDBManager instance created DB: '{self.db_name}', Collection: '{self.collection_name}'")
+
+        if batch_size is None:
+            # Read once per process; .env is loaded here too, since initialize_client()
+            # skips it when given an explicit connection string
+            if MongoDBManagerBase._env_batch_size is None:
+                _load_dotenv_once()
+                MongoDBManagerBase._env_batch_size = int(os.getenv("MONGO_BULK_BATCH_SIZE", 0))
+            batch_size = MongoDBManagerBase._env_batch_size or self.BULK_BATCH_SIZE
+        self.batch_size = self._check_batch_size(batch_size)
+
+    @staticmethod
+    def _check_batch_size(batch_size) -> int:
+        """Return batch_size if it is a positive int, else raise ValueError."""
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError(f"Batch size must be a positive integer, got {batch_size!r}")
+        return batch_size
+
+    def _resolve_batch_size(self, batch_size: int = None) -> int:
+        """Per-call batch size: None means self.batch_size; anything else must be a positive int."""
+        if batch_size is None:
+            return self.batch_size
+        return self._check_batch_size(batch_size)
+
+    def _batches(self, docs: Iterable[Dict], batch_size: int = None):
+        """Yield docs in lists of batch_size (default: self.batch_size)."""
+        batch_size = self._resolve_batch_size(batch_size)
+        if isinstance(docs, (list, tuple)):
+            for i in range(0, len(docs), batch_size):
+                yield docs[i:i + batch_size]
+            return
+        it = iter(docs)
+        while True:
+            chunk = list(islice(it, batch_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _log_inserted(self, data, count):
+        """Log an insert summary; the payload itself is only serialized at DEBUG level."""
+        logger.info("Inserted %d docs into %s.%s", count, self.db_name, self.collection_name)
+        if data is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("payload: %s", _DEBUG_ENCODER.encode(data))
+
+    @staticmethod
+    def _fast_write_concern(w, bypass_validation) -> WriteConcern:
+        """Write concern for insert_many_fast(); rejects options PyMongo refuses."""
+        if bypass_validation and w == 0:
+            raise ValueError("bypass_validation cannot be used with unacknowledged writes (w=0)")
+        return WriteConcern(w=w)
+
+    @staticmethod
+    def _index_models(specs) -> List[IndexModel]:
+        """Accept IndexModel objects or plain key specs."""
+        return [s if isinstance(s, IndexModel) else IndexModel(s) for s in specs]
+
+    @staticmethod
+    def _models_from_index_info(info: Dict[str, Dict[str, Any]]) -> List[IndexModel]:
+        """Rebuildable IndexModels from index_information(), skipping _id_."""
+        models = []
+        for name, spec in info.items():
+            if name == '_id_':
+                continue
+            options = {k: v for k, v in spec.items() if k not in ('key', 'v', 'ns')}
+            models.append(IndexModel(spec['key'], name=name, **options))
+        return models
+
+    # Exact-type dispatch for insert_document; subclasses (OrderedDict, SON, ...)
+    # fall back to the isinstance scan below. Method names rather than functions,
+    # so manager subclasses that override a handler are honoured.
+    _INSERT_DISPATCH = {
+        dict: '_insert_one',
+        list: '_insert_many',
+        tuple: '_insert_many',
+        GeneratorType: 'insert_stream',
+    }
+
+    def _insert_handler(self, data):
+        """Bound insert method for data's type, or None if unsupported."""
+        name = self._INSERT_DISPATCH.get(type(data))
+        if name is None:
+            name = next((n for t, n in self._INSERT_DISPATCH.items() if isinstance(data, t)), None)
+        return getattr(self, name) if name else None
+
+    def find_many(self, filter_dict=None, *, projection=None, batch_size: int = 500,
+                  limit: int = 0, sort=None):
+        """
+        Return a cursor that streams matches in batches of batch_size.
+        Iterate over it (`async for` with AsyncMongoDBManager); only call
+        list() on it when limit bounds the result. Building the cursor does
+        no I/O, so this is a plain method for both managers.
+        """
+        cursor = self.collection.find(filter_dict or {}, projection=projection)
+        if sort:
+            cursor = cursor.sort(sort)
+        if limit:
+            cursor = cursor.limit(limit)
+        return cursor.batch_size(batch_size)
+
+
+class MongoDBManager(MongoDBManagerBase):
+    """
+    A robust class to manage MongoDB operations.
+    The MongoClient instance is managed as a class-level singleton
+    to ensure it's initialized once and reused across the application.
+    Clients are keyed by PID: PyMongo clients are not fork-safe, so each
+    forked worker lazily builds its own from the settings recorded by
+    initialize_client().
+    """
+    __slots__ = ('_client',)
+
+    _clients: Dict[int, MongoClient] = {}
+    _client_settings: Dict[str, Any] = None
+    _verify_connection: bool = False
+    _collection_cache: Dict[Tuple[str, str], Collection] = {}
+
+    @classmethod
+    def initialize_client(
+        cls,
+        connection_string: str = None,
+        *,
+        max_pool_size: int = None,
+        min_pool_size: int = None,
+        compressors: str = None,
+        server_selection_timeout_ms: int = None,
+        w: Union[int, str] = None,
+        verify_connection: bool = False,
+    ):
+        """
+        Initializes the *singleton* MongoClient instance.
+        This method should be called once at application startup.
+        Pool, compression, timeout and write concern settings fall back to the
+        MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE, MONGO_COMPRESSORS,
+        MONGO_SERVER_SELECTION_TIMEOUT_MS and MONGO_WRITE_CONCERN_W env vars,
+        then to the defaults below.
+        PyMongo connects lazily on the first operation; pass verify_connection=True
+        (e.g. for long-running servers) to ping the server up front and fail early.
+        """
+        if os.getpid() in cls._clients:
+            logger.info("MongoDB client already initialized.")
+            return
+
+        cls._client_settings = cls._resolve_client_settings(
+            connection_string,
+            max_pool_size=max_pool_size,
+            min_pool_size=min_pool_size,
+            compressors=compressors,
+            server_selection_timeout_ms=server_selection_timeout_ms,
+            w=w,
+        )
+        cls._verify_connection = verify_connection
+        try:
+            cls._get_client()
+        except (ConnectionFailure, PyMongoError):
+            cls._client_settings = None
+            raise
+
+    @classmethod
+    def _build_client(cls):
+        """Create a MongoClient from the recorded settings, optionally testing the connection."""
+        try:
+            client = MongoClient(**cls._client_settings)
+            if cls._verify_connection:
+                client.admin.command('ping')  # Test connection
+            logger.info("MongoDB client initialized successfully.")
+        except (ConnectionFailure, PyMongoError) as e:
+            logger.error("FATAL: MongoDB connection failed during initialization: %s", e)
+            raise
+        return client
+
+    @classmethod
+    def _get_client(cls):
+        """Return this process's MongoClient, building it on first use after a fork."""
+        if cls._client_settings is None:
+            raise RuntimeError("MongoDB client not initialized. Call initialize_client() first.")
+        pid = os.getpid()
+        client = cls._clients.get(pid)
+        if client is None:
+            client = cls._build_client()
+            cls._clients[pid] = client
+        return client
+    
+    @classmethod
+    def close_client(cls, clear_cached_connection_string: bool = False):
+        """
+        Close the current process's client.
+        The connection string read from the environment stays cached unless
+        clear_cached_connection_string is True.
+        """
+        client = cls._clients.pop(os.getpid(), None)
+        cls._client_settings = None
+        cls._collection_cache.clear()
+        if clear_cached_connection_string:
+            cls._resolved_conn_str = None
+        if client:
+            client.close()
+            logger.info("MongoDB client closed.")
+
+    def __init__(self, db_name, collection_name, batch_size: int = None):
+        """
+        Initializes an instance of MongoDBManager for a specific database and collection.
+        Relies on initialize_client() having been called in this process or its parent.
+        batch_size overrides BULK_BATCH_SIZE (or the MONGO_BULK_BATCH_SIZE env var)
+        for bulk inserts.
+        """
+        self._client = type(self)._get_client()
+        self._set_target(db_name, collection_name, batch_size)
+
+        # Cache database and collection references across instances. A handle
+        # inherited through fork() belongs to the parent's client, so rebuild it.
+        key = (db_name, collection_name)
+        coll = type(self)._collection_cache.get(key)
+        if coll is None or coll.database.client is not self._client:
+            coll = self._client[db_name][collection_name]
+            type(self)._collection_cache[key] = coll
+        self.collection = coll
+        self.db = coll.database
+        logger.info("MongoDBManager instance created DB: '%s', Collection: '%s'",
+                    self.db_name, self.collection_name)
 
     # Add your CRUD operations here
-    def insert_document(self, data: Union[Dict, List[Dict]]) -> Tuple[bool, Any]:
+    def _insert_one(self, data: Dict) -> Tuple[bool, Any]:
+        # Single document insertion
+        result = self.collection.insert_one(data)
+        self._log_inserted(data, 1)
+        return result.acknowledged, result.inserted_id
+
+    def _insert_batches(self, docs: Iterable[Dict], batch_size: int = None) -> Tuple[bool, List[Any]]:
+        # Unordered insert_many per batch, collecting ids across batches
+        ids = []
+        ack = True
+        for chunk in self._batches(docs, batch_size):
+            result = self.collection.insert_many(chunk, ordered=False, bypass_document_validation=False)
+            ids.extend(result.inserted_ids)
+            ack &= result.acknowledged
+        return ack, ids
+
+    def _insert_many(self, data: Union[List[Dict], Tuple[Dict, ...]]) -> Tuple[bool, Any]:
+        # Multiple documents insertion, in unordered batches of batch_size.
+        # An empty list is a failure, as insert_many([]) has always made it.
+        if not data:
+            logger.error("Error inserting data: no documents to insert")
+            return False, None
+        ack, ids = self._insert_batches(data)
+        self._log_inserted(data, len(data))
+        return ack, ids
+
+    def insert_stream(self, it: Iterable[Dict], batch_size: int = None) -> Tuple[bool, Any]:
+        """
+        Insert documents from any iterable, batch_size (default: self.batch_size)
+        at a time, so peak memory is one batch rather than the whole input.
+        ETL jobs should pass generators directly (file lines, another cursor, ...).
+        Generators given to insert_document() are routed here.
+        """
+        ack, ids = self._insert_batches(it, self._resolve_batch_size(batch_size))
+        self._log_inserted(None, len(ids))
+        return ack, ids
+
+    def insert_document(self, data: Union[Dict, List[Dict], Iterable[Dict]]) -> Tuple[bool, Any]:
         try:
-        
-            # Handle both single document and multiple documents
-            if isinstance(data, dict):
-                # Single document insertion
-                result = self.collection.insert_one(data)
-                
-                print("=== SINGLE DOCUMENT INSERTED ===")
-                print(f"Database: {self.db_name}")
-                print(f"Collection: {self.collection_name}")
-                print(f"Created Data:")
-                print(json.dumps(data, indent=2, default=str))
-                return result.acknowledged, result.inserted_id
-            
-            elif isinstance(data, list):
-                # Multiple documents insertion
-                result = self.collection.insert_many(data)
-
-                print ("=== MULTIPLE DOCUMENTS INSERTION ===")
-                print(f"Database: {self.db_name}")
-                print(f"Collection: {self.collection_name}")
-                print(f"Created Data:")
-                print(json.dumps(data, indent=2, default=str))
-                return result.acknowledged, result.inserted_ids
-            
-            else:
-                print("Error: Data must be a dictionary or list of dictionaries")
+            # Handle single documents, sequences and generators of documents
+            handler = self._insert_handler(data)
+            if handler is None:
+                logger.error("Data must be a dictionary or list of dictionaries")
                 return False, None
+            return handler(data)
             
         except Exception as e:
-            logging.error(f"Error inserting data: {str(e)}")
-            print(f"Error inserting data: {str(e)}")
+            logger.error("Error inserting data: %s", e)
             return False, None
 
+    def insert_many_fast(self, data: List[Dict], w: int = 0, ordered: bool = False,
+                         bypass_validation: bool = False):
+        """
+        Fire-and-forget bulk insert for initial loads / ETL.
+        With the default w=0 the server does not acknowledge the writes, so
+        failures (duplicate keys, validation errors, dropped connections) are
+        silently lost and result.inserted_ids are client-side ids only.
+        bypass_validation requires an acknowledged write concern (w >= 1);
+        PyMongo rejects it for unacknowledged writes.
+        Use insert_document() when every write must be confirmed.
+        """
+        coll = self.collection.with_options(write_concern=self._fast_write_concern(w, bypass_validation))
+        return coll.insert_many(data, ordered=ordered, bypass_document_validation=bypass_validation)
+
+    def bulk_write_ops(self, ops: List[Union[InsertOne, UpdateOne, DeleteOne]], ordered: bool = False):
+        """
+        Send a mixed list of InsertOne/UpdateOne/DeleteOne operations in one bulk_write
+        instead of one round trip per operation. Pure inserts should keep using
+        insert_document().
+        """
+        return self.collection.bulk_write(ops, ordered=ordered, bypass_document_validation=False)
+
+    def drop_nonid_indexes(self) -> List[IndexModel]:
+        """
+        Drop every index except _id before a large bulk load and return the
+        dropped indexes as IndexModels, ready to pass back to ensure_indexes().
+        MongoDB updates each secondary index for every inserted document, so
+        the usual ETL pattern is:
+            saved = drop_nonid_indexes()
+            insert_stream() / insert_many_fast() in batches
+            ensure_indexes(saved)   # rebuild in one pass
+        (insert_many_fast() can only skip validation with w >= 1.)
+        Unique indexes are not enforced while they are dropped, so duplicates
+        loaded in between make the unique rebuild in ensure_indexes() fail.
+        """
+        saved = self._models_from_index_info(self.collection.index_information())
+        self.collection.drop_indexes()
+        return saved
+
+    def ensure_indexes(self, specs):
+        """
+        Create indexes from IndexModel objects or plain key specs
+        (e.g. "email" or [("name", 1), ("age", -1)]).
+        """
+        return self.collection.create_indexes(self._index_models(specs))
+
     def find_one(self, filter_dict):
         return self.collection.find_one(filter_dict)
     
-    def find_many(self, filter_dict=None):
-        return self.collection.find(filter_dict or {})
-    
     def update_one(self, filter_dict, update_dict):
         return self.collection.update_one(filter_dict, update_dict)
     
@@ -154,7 +472,7 @@ if __name__ == "__main__":
     """
     Main function to demonstrate MongoDB operations using the singleton MongoClient.
     """
-    logging.info("Starting application...")
+    logger.info("Starting application...")
     try:
         # Initialize once at app startup
         MongoDBManager.initialize_client()
@@ -173,6 +491,13 @@ if __name__ == "__main__":
         # Multiple Document insertion
         success, inserted_id = user_manager.insert_document([{"name": "Frank", "email": "frank@example.com"},{"name": "Daniel", "email": "daniel@example.com"}])
         print(f"Success={success}, ID={inserted_id}")
+
+        # Mixed insert/update in a single round trip
+        result = user_manager.bulk_write_ops([
+            InsertOne({"name": "Grace", "email": "grace@example.com"}),
+            UpdateOne({"name": "Jack"}, {"$set": {"email": "jack@example.org"}}),
+        ])
+        print(f"Inserted={result.inserted_count}, Modified={result.modified_count}")
  
         # Test validation (these will raise errors)
         # MongoDBManager("", "users")  # Empty db name
@@ -180,8 +505,8 @@ if __name__ == "__main__":
         # MongoDBManager(123, " ")  # Wrong type
         
     except (TypeError, ValueError) as e:
-        logging.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
     except Exception as e:
-        logging.error(f"Application error: {e}")
+        logger.error("Application error: %s", e)
     finally:
         MongoDBManager.close_client()
\ No newline at end of file
@@ -0,0 +1,211 @@
+from pymongo import AsyncMongoClient, InsertOne, UpdateOne, DeleteOne
+from pymongo.errors import ConnectionFailure, PyMongoError
+from typing import Union, List, Dict, Any, Tuple, Iterable, AsyncIterable
+from types import AsyncGeneratorType
+import asyncio
+import logging
+
+from Mongodb_manager import MongoDBManagerBase
+
+logger = logging.getLogger(__name__)
+
+class AsyncMongoDBManager(MongoDBManagerBase):
+    """
+    asyncio counterpart of MongoDBManager built on PyMongo's AsyncMongoClient
+    (PyMongo >= 4.13; it replaces the deprecated Motor driver).
+    Methods mirror MongoDBManager but are coroutines, so many concurrent
+    inserts share one thread and overlap their network waits instead of
+    each pinning a worker thread.
+    The AsyncMongoClient is a class-level singleton. It is bound to the
+    event loop it was first used on, so initialize it from inside the
+    application's running loop.
+    """
+    __slots__ = ()
+
+    _client: AsyncMongoClient = None
+    # Async generators stream through insert_stream() as well
+    _INSERT_DISPATCH = {**MongoDBManagerBase._INSERT_DISPATCH, AsyncGeneratorType: 'insert_stream'}
+
+    @classmethod
+    async def initialize_client(
+        cls,
+        connection_string: str = None,
+        *,
+        max_pool_size: int = None,
+        min_pool_size: int = None,
+        compressors: str = None,
+        server_selection_timeout_ms: int = None,
+        w: Union[int, str] = None,
+        verify_connection: bool = False,
+    ):
+        """
+        Initializes the *singleton* AsyncMongoClient instance.
+        Accepts the same settings and env var fallbacks as
+        MongoDBManager.initialize_client().
+        """
+        if cls._client is not None:
+            logger.info("Async MongoDB client already initialized.")
+            return
+
+        settings = cls._resolve_client_settings(
+            connection_string,
+            max_pool_size=max_pool_size,
+            min_pool_size=min_pool_size,
+            compressors=compressors,
+            server_selection_timeout_ms=server_selection_timeout_ms,
+            w=w,
+        )
+        try:
+            client = AsyncMongoClient(**settings)
+            if verify_connection:
+                await client.admin.command('ping')  # Test connection
+            cls._client = client
+            logger.info("Async MongoDB client initialized successfully.")
+        except (ConnectionFailure, PyMongoError) as e:
+            logger.error("FATAL: MongoDB connection failed during initialization: %s", e)
+            raise
+
+    @classmethod
+    async def close_client(cls):
+        """Close the singleton client."""
+        if cls._client:
+            client, cls._client = cls._client, None
+            await client.close()
+            logger.info("Async MongoDB client closed.")
+
+    def __init__(self, db_name, collection_name, batch_size: int = None):
+        """
+        Initializes an instance of AsyncMongoDBManager for a specific database and collection.
+        Relies on the class-level _client being already initialized.
+        """
+        if self._client is None:
+            raise RuntimeError("Async MongoDB client not initialized. Call initialize_client() first.")
+
+        self._set_target(db_name, collection_name, batch_size)
+        self.db = self._client[db_name]
+        self.collection = self.db[collection_name]
+        logger.info("AsyncMongoDBManager instance created DB: '%s', Collection: '%s'",
+                    self.db_name, self.collection_name)
+
+    async def _insert_batches(self, docs: Iterable[Dict], batch_size: int = None) -> Tuple[bool, List[Any]]:
+        # Unordered insert_many per batch, collecting ids across batches
+        ids = []
+        ack = True
+        for chunk in self._batches(docs, batch_size):
+            result = await self.collection.insert_many(chunk, ordered=False, bypass_document_validation=False)
+            ids.extend(result.inserted_ids)
+            ack &= result.acknowledged
+        return ack, ids
+
+    async def _insert_one(self, data: Dict) -> Tuple[bool, Any]:
+        # Single document insertion
+        result = await self.collection.insert_one(data)
+        self._log_inserted(data, 1)
+        return result.acknowledged, result.inserted_id
+
+    async def _insert_many(self, data: Union[List[Dict], Tuple[Dict, ...]]) -> Tuple[bool, Any]:
+        # Multiple documents insertion, in unordered batches of batch_size.
+        # An empty list is a failure, matching MongoDBManager._insert_many()
+        if not data:
+            logger.error("Error inserting data: no documents to insert")
+            return False, None
+        ack, ids = await self._insert_batches(data)
+        self._log_inserted(data, len(data))
+        return ack, ids
+
+    async def insert_stream(self, it: Union[Iterable[Dict], AsyncIterable[Dict]],
+                            batch_size: int = None) -> Tuple[bool, Any]:
+        """
+        Insert documents from any iterable or async iterable, batch_size
+        (default: self.batch_size) at a time; see MongoDBManager.insert_stream().
+        Generators and async generators given to insert_document() are routed here.
+        """
+        batch_size = self._resolve_batch_size(batch_size)
+        if not hasattr(it, '__aiter__'):
+            ack, ids = await self._insert_batches(it, batch_size)
+        else:
+            ids = []
+            ack = True
+            chunk = []
+            async for doc in it:
+                chunk.append(doc)
+                if len(chunk) >= batch_size:
+                    a, i = await self._insert_batches(chunk, batch_size)
+                    ack &= a
+                    ids.extend(i)
+                    chunk = []
+            if chunk:
+                a, i = await self._insert_batches(chunk, batch_size)
+                ack &= a
+                ids.extend(i)
+        self._log_inserted(None, len(ids))
+        return ack, ids
+
+    async def insert_document(self, data: Union[Dict, List[Dict], Iterable[Dict]]) -> Tuple[bool, Any]:
+        try:
+            # Handle single documents, sequences and (async) generators of documents
+            handler = self._insert_handler(data)
+            if handler is None:
+                logger.error("Data must be a dictionary or list of dictionaries")
+                return False, None
+            return await handler(data)
+
+        except Exception as e:
+            logger.error("Error inserting data: %s", e)
+            return False, None
+
+    async def insert_many_fast(self, data: List[Dict], w: int = 0, ordered: bool = False,
+                               bypass_validation: bool = False):
+        """
+        Fire-and-forget bulk insert; see MongoDBManager.insert_many_fast().
+        With w=0 write errors are silently lost, and bypass_validation is rejected.
+        """
+        coll = self.collection.with_options(write_concern=self._fast_write_concern(w, bypass_validation))
+        return await coll.insert_many(data, ordered=ordered, bypass_document_validation=bypass_validation)
+
+    async def bulk_write_ops(self, ops: List[Union[InsertOne, UpdateOne, DeleteOne]], ordered: bool = False):
+        """Send a mixed list of write operations in one bulk_write."""
+        return await self.collection.bulk_write(ops, ordered=ordered, bypass_document_validation=False)
+
+    async def drop_nonid_indexes(self):
+        """
+        Drop every index except _id and return them for ensure_indexes();
+        see MongoDBManager.drop_nonid_indexes() (unique indexes are not enforced meanwhile).
+        """
+        saved = self._models_from_index_info(await self.collection.index_information())
+        await self.collection.drop_indexes()
+        return saved
+
+    async def ensure_indexes(self, specs):
+        """Create indexes from IndexModel objects or plain key specs."""
+        return await self.collection.create_indexes(self._index_models(specs))
+
+    async def find_one(self, filter_dict):
+        return await self.collection.find_one(filter_dict)
+
+    async def update_one(self, filter_dict, update_dict):
+        return await self.collection.update_one(filter_dict, update_dict)
+
+    async def delete_one(self, filter_dict):
+        return await self.collection.delete_one(filter_dict)
+
+
+# Usage example
+if __name__ == "__main__":
+    async def main():
+        await AsyncMongoDBManager.initialize_client()
+        try:
+            user_manager = AsyncMongoDBManager("test_db", "test_collection")
+
+            # Concurrent inserts overlap their round trips
+            results = await asyncio.gather(
+                user_manager.insert_document({"name": "Jack", "email": "jack@example.com"}),
+                user_manager.insert_document([{"name": "Frank", "email": "frank@example.com"},
+                                              {"name": "Daniel", "email": "daniel@example.com"}]),
+            )
+            for success, inserted_id in results:
+                print(f"Success={success}, ID={inserted_id}")
+        finally:
+            await AsyncMongoDBManager.close_client()
+
+    asyncio.run(main())
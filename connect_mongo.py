@@ -1,35 +1,54 @@
 from pymongo import MongoClient
+from typing import Dict
+import atexit
 
-def insert_data_mongo(conn_str, db_name, collection_name, data):
+# One client (and connection pool) per connection string, reused across calls
+_clients: Dict[str, MongoClient] = {}
 
-    # Connect to MongoDB
-    client = MongoClient(conn_str)
+def _get_client(conn_str):
+    client = _clients.get(conn_str)
+    if client is None:
+        client = MongoClient(conn_str, maxPoolSize=50, compressors="zstd,snappy")
+        _clients[conn_str] = client
+    return client
+
+@atexit.register
+def _close_clients():
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
+
+def insert_data_mongo(conn_str, db_name, collection_name, data, debug=False):
+
+    # Connect to MongoDB (cached client, never closed here)
+    client = _get_client(conn_str)
     db = client[db_name]
     collection = db[collection_name]
 
-    # Print list of databases in the current cluster
-    for db_name in client.list_database_names():
-        print(db_name)
+    # Print list of databases in the current cluster (extra round trip, debug only)
+    if debug:
+        for name in client.list_database_names():
+            print(name)
 
     # Insert documents
     if isinstance(data, dict):
         result = collection.insert_one(data)
         print("Inserted 1 document.")
 
-        # Fetch and print inserted document
-        inserted_docs = collection.find_one({"_id": result.inserted_id})
-        print(inserted_docs)
-        return inserted_docs
+        # Return the document we already hold instead of reading it back
+        data['_id'] = result.inserted_id
+        print(data)
+        return data
         
     elif isinstance(data, list):
         result = collection.insert_many(data)
         print(f"Inserted {len(result.inserted_ids)} documents.")
-            
-        # Fetch and print inserted documents
-        inserted_docs = list(collection.find({"_id": {"$in": result.inserted_ids}}))
-        for doc in inserted_docs:
+
+        # Return the documents we already hold instead of reading them back
+        for doc, _id in zip(data, result.inserted_ids):
+            doc['_id'] = _id
             print(doc)
-        return inserted_docs
+        return data
     
     else:
         print ("Data must be a dictionary or a list of dictionaries.")